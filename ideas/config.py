@@ -145,16 +145,20 @@ class Strategy:
     num_patches: decompose domain to enable threads, streams, or multiple GPU's
     num_threads: use a thread pool of this size to drive a multi-patch solver
     gpu_streams: use the per-thread-default-stream, or one stream per grid patch
+    numba:       use a Numba-compiled update kernel in place of native code (cpu)
+    cache_block: tile size of 2d loops over zones, 0 for no tiling (cpu)
     """
 
     hardware: Literal["cpu", "gpu"] = "cpu"
-    data_layout: Literal["fields-first", "fields-last"] = "fields-last"
+    data_layout: Literal["fields-first", "fields-last"] = "fields-first"
     cache_flux: bool = False
     cache_prim: bool = False
     cache_grad: bool = False
     num_patches: int = 1
     num_threads: int = 1
     gpu_streams: Literal["per-thread", "per-patch"] = "per-thread"
+    numba: bool = False
+    cache_block: int = 32
 
     @property
     def transpose(self):
@@ -258,6 +262,18 @@ class Sailfish:
                 f"curvilinear coordinates only implemented for newtonian hydro"
             )
 
+        if self.strategy.numba and self.strategy.hardware != "cpu":
+            raise ValueError(f"numba kernels are only available on the cpu")
+
+        if self.strategy.numba and self.physics.metric != "newtonian":
+            raise ValueError(f"numba kernels only implemented for newtonian hydro")
+
+        if self.strategy.numba and self.strategy.cache_flux:
+            raise ValueError(f"numba kernels do not support the cache_flux strategy")
+
+        if self.strategy.cache_block < 0:
+            raise ValueError(f"cache_block must be non-negative")
+
 
 def parse_num_zones(arg):
     """
@@ -435,6 +451,20 @@ def add_config_arguments(parser: "argparser.ArgumentParser"):
         dest="strategy.cache_grad",
         default=None,
     )
+    parser.add_argument(
+        "--cache-block",
+        type=int,
+        help=Strategy.describe("cache_block"),
+        dest="strategy.cache_block",
+        metavar="B",
+    )
+    parser.add_argument(
+        "--numba",
+        action="store_true",
+        help=Strategy.describe("numba"),
+        dest="strategy.numba",
+        default=None,
+    )
     parser.add_argument(
         "--metric",
         type=str,
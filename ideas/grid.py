@@ -1,4 +1,4 @@
-from numpy import zeros, linspace, meshgrid, exp
+from numpy import zeros, arange, meshgrid, exp
 
 
 def copy_guard_zones(grid):
@@ -25,13 +25,9 @@ def cell_center_coordinates(i, j, ni_patches, nj_patches, ni, nj):
     ddx = dx / ni
     ddy = dy / nj
     x0 = -0.5 + (i + 0) * dx
-    x1 = -0.5 + (i + 1) * dx
     y0 = -0.5 + (j + 0) * dy
-    y1 = -0.5 + (j + 1) * dy
-    xv = linspace(x0 - 2 * ddx, x1 + 2 * ddy, ni + 5)
-    yv = linspace(y0 - 2 * ddx, y1 + 2 * ddy, nj + 5)
-    xc = 0.5 * (xv[1:] + xv[:-1])
-    yc = 0.5 * (yv[1:] + yv[:-1])
+    xc = x0 + (arange(ni + 4) - 1.5) * ddx
+    yc = y0 + (arange(nj + 4) - 1.5) * ddy
     return meshgrid(xc, yc, indexing="ij")
 
 
@@ -43,14 +43,25 @@ KERNEL_DEFINE_MACROS_CPU = R"""
 #define CPU_MODE
 #define DEVICE static
 #define KERNEL
+#define SIMD _Pragma("omp simd")
+#define ALWAYS_INLINE __attribute__((always_inline)) inline
 
 #define FOR_RANGE_1D(I0, I1) \
 for (int i = I0; i < I1; ++i) \
 
+#if defined(TILE_I) && defined(TILE_J)
+#define FOR_RANGE_2D(I0, I1, J0, J1) \
+for (int _ib = I0; _ib < I1; _ib += TILE_I) \
+for (int _jb = J0; _jb < J1; _jb += TILE_J) \
+for (int i = _ib; i < _ib + TILE_I && i < I1; ++i) \
+for (int j = _jb; j < _jb + TILE_J && j < J1; ++j) \
+
+#else
 #define FOR_RANGE_2D(I0, I1, J0, J1) \
 for (int i = I0; i < I1; ++i) \
 for (int j = J0; j < J1; ++j) \
 
+#endif
 #define FOR_RANGE_3D(I0, I1, J0, J1, K0, K1) \
 for (int i = I0; i < I1; ++i) \
 for (int j = J0; j < J1; ++j) \
@@ -66,6 +77,8 @@ KERNEL_DEFINE_MACROS_GPU = R"""
 #define GPU_MODE
 #define DEVICE static __device__
 #define KERNEL extern "C" __global__
+#define SIMD
+#define ALWAYS_INLINE __forceinline__
 
 #define FOR_RANGE_1D(I0, I1) \
 int i = threadIdx.x + blockIdx.x * blockDim.x; \
@@ -319,7 +332,7 @@ def cpu_extension(code, name, define_macros=list()):
             name,
             code,
             define_macros=define_macros,
-            extra_compile_args=["-std=c99"],
+            extra_compile_args=["-std=c99", "-fopenmp-simd"],
         )
         target = ffi.compile(tmpdir=cache_dir or ".", verbose=verbose)
         module = CDLL(target)
@@ -342,6 +355,10 @@ def gpu_extension(code, name, define_macros=list()):
 
         code = KERNEL_DEFINE_MACROS_GPU + code
         options = tuple(f"-D {k}={v}" for k, v in define_macros)
+        options += (
+            f"-D THREAD_BLOCK_SIZE_2D_I={THREAD_BLOCK_SIZE_2D[0]}",
+            f"-D THREAD_BLOCK_SIZE_2D_J={THREAD_BLOCK_SIZE_2D[1]}",
+        )
         define_str = define_macros_string(define_macros)
         module = RawModule(code=code, options=options)
         module.compile()
@@ -668,8 +685,7 @@ def kernel_class(cls):
 
 def kernel_metadata(kernel):
     metadata = dict()
-    cpu_func = kernel.__cpu_func__
-    gpu_func = kernel.__gpu_func__
+    gpu_func = getattr(kernel, "__gpu_func__", None)
 
     metadata["name"] = kernel.__name__
 
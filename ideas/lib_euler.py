@@ -54,7 +54,7 @@ static = R"""
 @device(static=static)
 def prim_to_cons(p: NDArray[float], u: NDArray[float]):
     R"""
-    DEVICE void prim_to_cons(double *p, double *u)
+    DEVICE void prim_to_cons(const double *p, double *u)
     {
         #if NVECS == 1
         double rho = p[RHO];
@@ -96,7 +96,7 @@ def prim_to_cons(p: NDArray[float], u: NDArray[float]):
 @device(static=static)
 def cons_to_prim(u: NDArray[float], p: NDArray[float]):
     R"""
-    DEVICE void cons_to_prim(double *u, double *p)
+    DEVICE void cons_to_prim(const double *u, double *p)
     {
         #if NVECS == 1
         double rho = u[DEN];
@@ -138,7 +138,7 @@ def cons_to_prim(u: NDArray[float], p: NDArray[float]):
 @device(static=static, device_funcs=[cons_to_prim])
 def cons_to_prim_check(u: NDArray[float], p: NDArray[float]) -> int:
     R"""
-    DEVICE int cons_to_prim_check(double *u, double *p)
+    DEVICE int cons_to_prim_check(const double *u, double *p)
     {
         cons_to_prim(u, p);
 
@@ -164,7 +164,7 @@ def prim_and_cons_to_flux(
     direction: int,
 ):
     R"""
-    DEVICE void prim_and_cons_to_flux(double *p, double *u, double *f, int direction)
+    DEVICE void prim_and_cons_to_flux(const double *p, const double *u, double *f, int direction)
     {
         double pre = p[PRE];
         double nrg = u[NRG];
@@ -195,7 +195,7 @@ def prim_and_cons_to_flux(
 @device(static=static, device_funcs=[prim_and_cons_to_flux])
 def prim_to_flux(p: NDArray[float], f: NDArray[float], direction: int):
     R"""
-    DEVICE void prim_and_cons_to_flux(double *p, double *f, int direction)
+    DEVICE void prim_and_cons_to_flux(const double *p, double *f, int direction)
     {
         double u[NCONS];
         prim_to_cons(p, u);
@@ -207,7 +207,7 @@ def prim_to_flux(p: NDArray[float], f: NDArray[float], direction: int):
 @device(static=static)
 def sound_speed_squared(p: NDArray[float]) -> float:
     R"""
-    DEVICE double sound_speed_squared(double *p)
+    DEVICE double sound_speed_squared(const double *p)
     {
         return p[PRE] / p[RHO] * GAMMA_LAW_INDEX;
     }
@@ -217,7 +217,7 @@ def sound_speed_squared(p: NDArray[float]) -> float:
 @device(static=static, device_funcs=[sound_speed_squared])
 def max_wavespeed(p: NDArray[float]) -> float:
     R"""
-    DEVICE double max_wavespeed(double *p)
+    DEVICE double max_wavespeed(const double *p)
     {
         #if NVECS == 1
         double cs = sqrt(sound_speed_squared(p));
@@ -255,7 +255,7 @@ def outer_wavespeeds(
 ):
     R"""
     DEVICE void outer_wavespeeds(
-        double *p,
+        const double *p,
         double *wavespeeds,
         int direction)
     {
@@ -282,7 +282,7 @@ def riemann_hlle(
     direction: int,
 ):
     R"""
-    DEVICE void riemann_hlle(double *pl, double *pr, double *flux, int direction)
+    DEVICE void riemann_hlle(const double *pl, const double *pr, double *flux, int direction)
     {
         double ul[NCONS];
         double ur[NCONS];
@@ -316,7 +316,7 @@ def source_terms_spherical_polar():
         double r0, double r1,
         double q0, double q1,
         double f0, double f1,
-        double *prim,
+        const double *prim,
         double *source)
     {
         // Forumulas below are A8 - A10 from Zhang & MacFadyen (2006), integrated
@@ -382,7 +382,7 @@ def source_terms_cylindrical_polar():
         double r0, double r1,
         double f0, double f1,
         double z0, double z1,
-        double *prim,
+        const double *prim,
         double *source)
     {
         // Forumulas below are A2 - A4 from Zhang & MacFadyen (2006), integrated
@@ -54,7 +54,7 @@ static = R"""
 @device(static=static)
 def prim_to_cons(p: NDArray[float], u: NDArray[float]):
     R"""
-    DEVICE void prim_to_cons(double *p, double *u)
+    DEVICE void prim_to_cons(const double *p, double *u)
     {
         #if NVECS == 1
         double rho = p[RHO];
@@ -102,7 +102,7 @@ def prim_to_cons(p: NDArray[float], u: NDArray[float]):
 @device(static=static)
 def cons_to_prim(u: NDArray[float], p: NDArray[float]):
     R"""
-    DEVICE void cons_to_prim(double *u, double *p)
+    DEVICE void cons_to_prim(const double *u, double *p)
     {
         int iteration = 0;
         int newton_iter_max = 50;
@@ -169,7 +169,7 @@ def cons_to_prim(u: NDArray[float], p: NDArray[float]):
 @device(static=static, device_funcs=[cons_to_prim])
 def cons_to_prim_check(u: NDArray[float], p: NDArray[float]) -> int:
     R"""
-    DEVICE int cons_to_prim_check(double *u, double *p)
+    DEVICE int cons_to_prim_check(const double *u, double *p)
     {
         cons_to_prim(u, p);
 
@@ -195,7 +195,7 @@ def prim_and_cons_to_flux(
     direction: int,
 ):
     R"""
-    DEVICE void prim_and_cons_to_flux(double *p, double *u, double *f, int direction)
+    DEVICE void prim_and_cons_to_flux(const double *p, const double *u, double *f, int direction)
     {
         #if NVECS == 1
         double gbx = p[UXX];
@@ -244,7 +244,7 @@ def prim_and_cons_to_flux(
 @device(static=static, device_funcs=[prim_and_cons_to_flux])
 def prim_to_flux(p: NDArray[float], f: NDArray[float], direction: int):
     R"""
-    DEVICE void prim_and_cons_to_flux(double *p, double *f, int direction)
+    DEVICE void prim_and_cons_to_flux(const double *p, double *f, int direction)
     {
         double u[NCONS];
         prim_to_cons(p, u);
@@ -256,7 +256,7 @@ def prim_to_flux(p: NDArray[float], f: NDArray[float], direction: int):
 @device(static=static)
 def sound_speed_squared(p: NDArray[float]) -> float:
     R"""
-    DEVICE double sound_speed_squared(double *p)
+    DEVICE double sound_speed_squared(const double *p)
     {
         double rho = p[DEN];
         double pre = p[PRE];
@@ -274,7 +274,7 @@ def outer_wavespeeds(
 ):
     R"""
     DEVICE void outer_wavespeeds(
-        double *p,
+        const double *p,
         double *wavespeeds,
         int direction)
     {
@@ -324,7 +324,7 @@ def outer_wavespeeds(
 )
 def max_wavespeed(p: NDArray[float]) -> float:
     R"""
-    DEVICE double max_wavespeed(double *p)
+    DEVICE double max_wavespeed(const double *p)
     {
         #if NVECS == 1
         double ai[2];
@@ -366,7 +366,7 @@ def riemann_hlle(
     direction: int,
 ):
     R"""
-    DEVICE void riemann_hlle(double *pl, double *pr, double *flux, int direction)
+    DEVICE void riemann_hlle(const double *pl, const double *pr, double *flux, int direction)
     {
         double ul[NCONS];
         double ur[NCONS];
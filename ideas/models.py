@@ -12,18 +12,14 @@ discriminating field.
 
 
 from typing import Literal, Union
-from numpy import logical_not, zeros, sqrt, sin, cos, pi
+from numpy import array, where, zeros, sqrt, sin, cos, pi
 from preset import preset
 from schema import schema
 from geometry import CoordinateBox
 
 
 def two_state(region_a, state_a, state_b):
-    region_b = logical_not(region_a)
-    p = zeros(region_a.shape + (len(state_a),))
-    p[region_a] = state_a
-    p[region_b] = state_b
-    return p
+    return where(region_a[..., None], array(state_a, float), array(state_b, float))
 
 
 @schema
@@ -151,7 +147,7 @@ class CylindricalExplosion:
     def primitive(self, box: CoordinateBox):
         x, y = box.cell_centers()
         return two_state(
-            sqrt(x**2 + y**2) < 0.1,
+            x * x + y * y < 0.1 * 0.1,
             [1.0, 0.0, 0.0, 1.000],
             [0.1, 0.0, 0.0, 0.125],
         )
@@ -191,7 +187,7 @@ class CylinderInWind:
     def primitive(self, box: CoordinateBox):
         x, y = box.cell_centers()
         return two_state(
-            sqrt(x**2 + y**2) < 0.1,
+            x * x + y * y < 0.1 * 0.1,
             [1e2, 0.0, 0.0, 1.0],
             [1.0, 1.0, 0.0, 0.1],
         )
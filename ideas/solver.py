@@ -26,21 +26,25 @@ from index_space import IndexSpace
 @device
 def plm_minmod(yl: float, yc: float, yr: float, plm_theta: float):
     R"""
-    #define min2(a, b) ((a) < (b) ? (a) : (b))
-    #define min3(a, b, c) min2(a, min2(b, c))
-    #define sign(x) copysign(1.0, x)
-    #define minabs(a, b, c) min3(fabs(a), fabs(b), fabs(c))
+    #define sgn(x) ((double)(((x) > 0.0) - ((x) < 0.0)))
 
-    DEVICE double plm_minmod(
+    DEVICE ALWAYS_INLINE double plm_minmod(
         double yl,
         double yc,
         double yr,
         double plm_theta)
     {
+        // Written without branches: the signs are data-dependent and poorly
+        // predicted near shocks. Using sgn(0) = 0 rather than copysign does
+        // not change the result, since then min(|a|, |b|, |c|) = 0.
         double a = (yc - yl) * plm_theta;
         double b = (yr - yl) * 0.5;
         double c = (yr - yc) * plm_theta;
-        return 0.25 * fabs(sign(a) + sign(b)) * (sign(a) + sign(c)) * minabs(a, b, c);
+        double sa = sgn(a);
+        double sb = sgn(b);
+        double sc = sgn(c);
+        double m = fmin(fmin(fabs(a), fabs(b)), fabs(c));
+        return 0.25 * fabs(sa + sb) * (sa + sc) * m;
     }
     """
 
@@ -84,7 +88,13 @@ class GradientEstimation:
         nk: int = None,
     ):
         R"""
-        KERNEL void plm_gradient(double *y, double *g, double plm_theta, int ni, int nj, int nk)
+        KERNEL void plm_gradient(
+            const double *__restrict__ y,
+            double *__restrict__ g,
+            double plm_theta,
+            int ni,
+            int nj,
+            int nk)
         {
             int nq = NFIELDS;
             int nd = ni * nj * nk * nq;
@@ -119,6 +129,53 @@ class GradientEstimation:
             #endif
             #endif
 
+            #if defined(GPU_MODE) && DIM == 2
+            // Each field is staged in a shared-memory tile with a one-zone
+            // halo, so that a thread block reads each primitive value from
+            // global memory once, rather than once for each stencil it is
+            // part of. All threads must reach the __syncthreads barriers, so
+            // the FOR_RANGE_2D macro (which returns early) is not used here.
+            __shared__ double tile[THREAD_BLOCK_SIZE_2D_I + 2][THREAD_BLOCK_SIZE_2D_J + 2];
+
+            int mi = THREAD_BLOCK_SIZE_2D_I + 2;
+            int mj = THREAD_BLOCK_SIZE_2D_J + 2;
+            int ti = threadIdx.x;
+            int tj = threadIdx.y;
+            int i0 = (int)(blockIdx.x * blockDim.x) - 1;
+            int j0 = (int)(blockIdx.y * blockDim.y) - 1;
+            int i = i0 + ti + 1;
+            int j = j0 + tj + 1;
+            int nccc = i * si + j * sj;
+            int interior = i >= 1 && i < ni - 1 && j >= 1 && j < nj - 1;
+
+            for (int q = 0; q < NFIELDS; ++q)
+            {
+                for (int m = tj * blockDim.x + ti; m < mi * mj; m += blockDim.x * blockDim.y)
+                {
+                    int ii = i0 + m / mj;
+                    int jj = j0 + m % mj;
+
+                    if (ii >= 0 && ii < ni && jj >= 0 && jj < nj)
+                    {
+                        tile[m / mj][m % mj] = y[ii * si + jj * sj + q * sq];
+                    }
+                }
+                __syncthreads();
+
+                if (interior)
+                {
+                    double yc = tile[ti + 1][tj + 1];
+                    double yl = tile[ti + 0][tj + 1];
+                    double yr = tile[ti + 2][tj + 1];
+                    double zl = tile[ti + 1][tj + 0];
+                    double zr = tile[ti + 1][tj + 2];
+                    g[0 * nd + nccc + q * sq] = plm_minmod(yl, yc, yr, plm_theta);
+                    g[1 * nd + nccc + q * sq] = plm_minmod(zl, yc, zr, plm_theta);
+                }
+                __syncthreads();
+            }
+            #else
+
             #if DIM == 1
             FOR_RANGE_1D(1, ni - 1)
             #elif DIM == 2
@@ -175,6 +232,7 @@ class GradientEstimation:
                     #endif
                 }
             }
+            #endif
         }
         """
         plm = plm_theta if plm_theta is not None else self._plm_theta
@@ -230,7 +288,10 @@ class Fields:
         ni: int = None,
     ):
         R"""
-        KERNEL void cons_to_prim_array(double *u, double *p, int ni)
+        KERNEL void cons_to_prim_array(
+            const double *__restrict__ u,
+            double *__restrict__ p,
+            int ni)
         {
             #if TRANSPOSE == 0
             int sq = 1;
@@ -270,7 +331,10 @@ class Fields:
         ni: int = None,
     ):
         R"""
-        KERNEL void prim_to_cons_array(double *p, double *u, int ni)
+        KERNEL void prim_to_cons_array(
+            const double *__restrict__ p,
+            double *__restrict__ u,
+            int ni)
         {
             #if TRANSPOSE == 0
             int sq = 1;
@@ -310,7 +374,10 @@ class Fields:
         ni: int = None,
     ):
         R"""
-        KERNEL void max_wavespeeds_array(double *u, double *a, int ni)
+        KERNEL void max_wavespeeds_array(
+            const double *__restrict__ u,
+            double *__restrict__ a,
+            int ni)
         {
             #if TRANSPOSE == 0
             int sq = 1;
@@ -389,10 +456,18 @@ class SourceTerms:
     Native implementation of source terms kernel
     """
     geometric_source_terms_code = R"""
-    KERNEL void geometric_source_terms(double *p, double *u, double *x, double *s, int ni, int nj, int nk)
+    KERNEL void geometric_source_terms(
+        const double *__restrict__ p,
+        const double *__restrict__ u,
+        const double *__restrict__ x,
+        double *__restrict__ s,
+        int ni,
+        int nj,
+        int nk)
     {
         int nq = NCONS;
         int nd = ni * nj * nk * nq;
+        int nz = ni * nj * nk;
 
         #if TRANSPOSE == 0
         #if DIM == 1
@@ -451,54 +526,54 @@ class SourceTerms:
 
             #if COORDS == 1 // spherical polar
             #if DIM == 1
-            double x0 = x[(0 * nd + nccc) / sf];
-            double x1 = x[(0 * nd + nrcc) / sf];
+            double x0 = x[0 * nz + nccc / sf];
+            double x1 = x[0 * nz + nrcc / sf];
             double y0 = 0.0;
             double y1 = M_PI;
             double z0 = 0.0;
             double z1 = 2.0 * M_PI;
 
             #elif DIM == 2
-            double x0 = x[(0 * nd + nccc) / sf];
-            double x1 = x[(0 * nd + nrcc) / sf];
-            double y0 = x[(1 * nd + nccc) / sf];
-            double y1 = x[(1 * nd + ncrc) / sf];
+            double x0 = x[0 * nz + nccc / sf];
+            double x1 = x[0 * nz + nrcc / sf];
+            double y0 = x[1 * nz + nccc / sf];
+            double y1 = x[1 * nz + ncrc / sf];
             double z0 = 0.0;
             double z1 = 2.0 * M_PI;
 
             #elif DIM == 3
-            double x0 = x[(0 * nd + nccc) / sf];
-            double x1 = x[(0 * nd + nrcc) / sf];
-            double y0 = x[(1 * nd + nccc) / sf];
-            double y1 = x[(1 * nd + ncrc) / sf];
-            double z0 = x[(2 * nd + nccc) / sf];
-            double z1 = x[(2 * nd + nccr) / sf];
+            double x0 = x[0 * nz + nccc / sf];
+            double x1 = x[0 * nz + nrcc / sf];
+            double y0 = x[1 * nz + nccc / sf];
+            double y1 = x[1 * nz + ncrc / sf];
+            double z0 = x[2 * nz + nccc / sf];
+            double z1 = x[2 * nz + nccr / sf];
             #endif
 
             #elif COORDS == 2 // cylindrical polar
             #if DIM == 1
-            double x0 = x[(0 * nd + nccc) / sf];
-            double x1 = x[(0 * nd + nrcc) / sf];
+            double x0 = x[0 * nz + nccc / sf];
+            double x1 = x[0 * nz + nrcc / sf];
             double y0 = 0.0;
             double y1 = 2.0 * M_PI;
             double z0 = 0.0;
             double z1 = 1.0;
 
             #elif DIM == 2
-            double x0 = x[(0 * nd + nccc) / sf];
-            double x1 = x[(0 * nd + nrcc) / sf];
+            double x0 = x[0 * nz + nccc / sf];
+            double x1 = x[0 * nz + nrcc / sf];
             double y0 = 0.0;
             double y1 = 2.0 * M_PI;
-            double z0 = x[(1 * nd + nccc) / sf];
-            double z1 = x[(1 * nd + ncrc) / sf];
+            double z0 = x[1 * nz + nccc / sf];
+            double z1 = x[1 * nz + ncrc / sf];
 
             #elif DIM == 3
-            double x0 = x[(0 * nd + nccc) / sf];
-            double x1 = x[(0 * nd + nrcc) / sf];
-            double y0 = x[(1 * nd + nccc) / sf];
-            double y1 = x[(1 * nd + ncrc) / sf];
-            double z0 = x[(2 * nd + nccc) / sf];
-            double z1 = x[(2 * nd + nccr) / sf];
+            double x0 = x[0 * nz + nccc / sf];
+            double x1 = x[0 * nz + nrcc / sf];
+            double y0 = x[1 * nz + nccc / sf];
+            double y1 = x[1 * nz + ncrc / sf];
+            double z0 = x[2 * nz + nccc / sf];
+            double z1 = x[2 * nz + nccr / sf];
             #endif
             #else
             #error("COORDS must be either 1 (spherical) or 2 (cylindrical)")
@@ -640,6 +715,10 @@ class Scheme:
         define_macros["CACHE_GRAD"] = int(config.strategy.cache_grad)
         define_macros["USE_RK"] = int(config.scheme.time_integration != "fwd")
 
+        if config.strategy.cache_block and config.domain.dimensionality == 2:
+            define_macros["TILE_I"] = config.strategy.cache_block
+            define_macros["TILE_J"] = config.strategy.cache_block
+
         r = config.scheme.reconstruction
 
         if type(r) is str:
@@ -676,15 +755,22 @@ class Scheme:
     def _godunov_fluxes(self):
         R"""
         DEVICE void _godunov_fluxes(
-            double *prd,
-            double *grd,
-            double *urd,
+            const double *prd,
+            const double *grd,
+            const double *urd,
             double fh[NCONS],
             double plm_theta,
             int axis,
             int si,
             int sq)
         {
+            // =====================================================
+            #if USE_PLM == 0 && CACHE_PRIM == 1 && TRANSPOSE == 0
+            // Piecewise constant primitives are contiguous in memory for the
+            // fields-last layout, so the Riemann solver reads them in place.
+            riemann_hlle(prd - si, prd, fh, axis);
+
+            #else
             double pp[NCONS];
             double pm[NCONS];
 
@@ -693,6 +779,7 @@ class Scheme:
             double ul[NCONS];
             double ur[NCONS];
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 ul[q] = urd[-1 * si + q * sq];
@@ -703,6 +790,7 @@ class Scheme:
 
             // =====================================================
             #elif USE_PLM == 0 && CACHE_PRIM == 1
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 pm[q] = prd[-1 * si + q * sq];
@@ -714,6 +802,7 @@ class Scheme:
             double u[4][NCONS];
             double p[4][NCONS];
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 u[0][q] = urd[-2 * si + q * sq];
@@ -726,6 +815,7 @@ class Scheme:
             cons_to_prim(u[2], p[2]);
             cons_to_prim(u[3], p[3]);
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 double gl = plm_minmod(p[0][q], p[1][q], p[2][q], plm_theta);
@@ -741,6 +831,7 @@ class Scheme:
             double pl[NCONS];
             double pr[NCONS];
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 ul[q] = urd[-1 * si + q * sq];
@@ -749,6 +840,7 @@ class Scheme:
             cons_to_prim(ul, pl);
             cons_to_prim(ur, pr);
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 double gl = grd[-1 * si + q * sq];
@@ -761,6 +853,7 @@ class Scheme:
             #elif USE_PLM == 1 && CACHE_PRIM == 1 && CACHE_GRAD == 0
             double p[4][NCONS];
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 p[0][q] = prd[-2 * si + q * sq];
@@ -769,6 +862,7 @@ class Scheme:
                 p[3][q] = prd[+1 * si + q * sq];
             }
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 double gl = plm_minmod(p[0][q], p[1][q], p[2][q], plm_theta);
@@ -779,6 +873,7 @@ class Scheme:
 
             // =====================================================
             #elif USE_PLM == 1 && CACHE_PRIM == 1 && CACHE_GRAD == 1
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 double pl = prd[-1 * si + q * sq];
@@ -792,16 +887,17 @@ class Scheme:
 
             // =====================================================
             riemann_hlle(pm, pp, fh, axis);
+            #endif
         }
         """
 
     godunov_fluxes_code = R"""
     KERNEL void godunov_fluxes(
-        double *prd,
-        double *urd,
-        double *grd,
-        double *fwr,
-        double *da,
+        const double *__restrict__ prd,
+        const double *__restrict__ urd,
+        const double *__restrict__ grd,
+        double *__restrict__ fwr,
+        const double *__restrict__ da,
         double plm_theta,
         int ni,
         int nj,
@@ -809,6 +905,7 @@ class Scheme:
     {
         int nq = NCONS;
         int nd = ni * nj * nk * nq;
+        int nz = ni * nj * nk;
 
         #if TRANSPOSE == 0
         #if DIM == 1
@@ -862,9 +959,10 @@ class Scheme:
             double am;
 
             #if DIM >= 1
-            am = da[(0 * nd + nc) / sf];
+            am = da[0 * nz + nc / sf];
 
             _godunov_fluxes(prd + nc, grd + 0 * nd + nc, urd + nc, fm, plm_theta, 1, si, sq);
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 fwr[0 * nd + nc + q * sq] = fm[q] * am;
@@ -872,9 +970,10 @@ class Scheme:
             #endif
 
             #if DIM >= 2
-            am = da[(1 * nd + nc) / sf];
+            am = da[1 * nz + nc / sf];
 
             _godunov_fluxes(prd + nc, grd + 1 * nd + nc, urd + nc, fm, plm_theta, 2, sj, sq);
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 fwr[1 * nd + nc + q * sq] = fm[q] * am;
@@ -882,9 +981,10 @@ class Scheme:
             #endif
 
             #if DIM >= 3
-            am = da[(2 * nd + nc) / sf];
+            am = da[2 * nz + nc / sf];
 
             _godunov_fluxes(prd + nc, grd + 2 * nd + nc, urd + nc, fm, plm_theta, 3, sk, sq);
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 fwr[2 * nd + nc + q * sq] = fm[q] * am;
@@ -981,14 +1081,14 @@ class Scheme:
     """
     update_cons_code = R"""
     KERNEL void update_cons(
-        double *prd,
-        double *grd,
-        double *urk,
-        double *urd,
-        double *uwr,
-        double *stm,
-        double *da,
-        double *dv,
+        const double *__restrict__ prd,
+        const double *__restrict__ grd,
+        const double *__restrict__ urk,
+        const double *__restrict__ urd,
+        double *__restrict__ uwr,
+        const double *__restrict__ stm,
+        const double *__restrict__ da,
+        const double *__restrict__ dv,
         double dt,
         double rk,
         double plm_theta,
@@ -998,6 +1098,7 @@ class Scheme:
     {
         int nq = NCONS;
         int nd = ni * nj * nk * nq;
+        int nz = ni * nj * nk;
 
         #if TRANSPOSE == 0
         #if DIM == 1
@@ -1078,6 +1179,9 @@ class Scheme:
             _godunov_fluxes(prd + nccr, grd + 2 * nd + nccr, urd + nccr, hp, plm_theta, 3, sk, sq);
             #endif
 
+            double dt_dv = dt / dv[nccc / sf];
+
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 int n = nccc + q * sq;
@@ -1086,18 +1190,18 @@ class Scheme:
                 double ap;
 
                 #if DIM >= 1
-                am = da[(0 * nd + nccc) / sf];
-                ap = da[(0 * nd + nrcc) / sf];
+                am = da[0 * nz + nccc / sf];
+                ap = da[0 * nz + nrcc / sf];
                 du -= fp[q] * ap - fm[q] * am;
                 #endif
                 #if DIM >= 2
-                am = da[(1 * nd + nccc) / sf];
-                ap = da[(1 * nd + ncrc) / sf];
+                am = da[1 * nz + nccc / sf];
+                ap = da[1 * nz + ncrc / sf];
                 du -= gp[q] * ap - gm[q] * am;
                 #endif
                 #if DIM >= 3
-                am = da[(2 * nd + nccc) / sf];
-                ap = da[(2 * nd + nccr) / sf];
+                am = da[2 * nz + nccc / sf];
+                ap = da[2 * nz + nccr / sf];
                 du -= hp[q] * ap - hm[q] * am;
                 #endif
 
@@ -1106,16 +1210,18 @@ class Scheme:
                     du += stm[n];
                 }
 
-                du *= dt / dv[n / sf];
-                uwr[n] = urd[n] + du;
+                du *= dt_dv;
+                double u1 = urd[n] + du;
 
                 #if USE_RK == 1
                 if (rk != 0.0)
                 {
-                    uwr[n] *= (1.0 - rk);
-                    uwr[n] += rk * urk[n];
+                    // (1 - rk) * u1 + rk * urk, as one multiply-add
+                    u1 += rk * (urk[n] - u1);
                 }
                 #endif
+
+                uwr[n] = u1;
             }
         }
     }
@@ -1253,11 +1359,11 @@ class Scheme:
     """
     update_cons_from_fluxes_code = R"""
     KERNEL void update_cons_from_fluxes(
-        double *urk,
-        double *q,
-        double *f,
-        double *stm,
-        double *dv,
+        const double *__restrict__ urk,
+        double *__restrict__ q,
+        const double *__restrict__ f,
+        const double *__restrict__ stm,
+        const double *__restrict__ dv,
         double dt,
         double rk,
         int ni,
@@ -1322,9 +1428,11 @@ class Scheme:
 
             double *uc = &q[nccc];
             #if USE_RK == 1
-            double *u0 = &urk[nccc];
+            const double *u0 = &urk[nccc];
             #endif
+            double dt_dv = dt / dv[nccc / sf];
 
+            SIMD
             for (int q = 0; q < NCONS; ++q)
             {
                 double du = 0.0;
@@ -1350,14 +1458,13 @@ class Scheme:
                     du += stm[nccc + q * sq];
                 }
 
-                du *= dt / dv[nccc / sf];
+                du *= dt_dv;
                 double u1 = uc[q * sq] + du;
 
                 #if USE_RK == 1
                 if (rk != 0.0)
                 {
-                    u1 *= (1.0 - rk);
-                    u1 += rk * u0[q * sq];
+                    u1 += rk * (u0[q * sq] - u1);
                 }
                 #endif
 
@@ -1566,8 +1673,23 @@ class PatchState:
 
     @property
     def primitive(self):
+        """
+        Primitive variables, in the memory space (host or GPU) of the solver
+        """
         return self._to_user_prim(self._u)
 
+    @property
+    def primitive_host(self):
+        """
+        Primitive variables, copied to host memory if necessary
+        """
+        p = self.primitive
+
+        try:
+            return p.get()
+        except AttributeError:
+            return p
+
     @property
     def total_zones(self):
         return prod(self._box.num_zones)
@@ -1609,6 +1731,10 @@ class State:
     def primitive(self):
         return concatenate([s.primitive for s in self._states])
 
+    @property
+    def primitive_host(self):
+        return concatenate([s.primitive_host for s in self._states])
+
     @property
     def total_zones(self):
         return sum(s.total_zones for s in self._states)
@@ -1664,6 +1790,8 @@ def make_worker_pool(num_threads):
 class SolverKernels(NamedTuple):
     """
     Collection of kernel functions used by the solver
+
+    Kernels which are not needed for a given configuration are `None`.
     """
 
     plm_gradient: Callable
@@ -1679,32 +1807,62 @@ class SolverKernels(NamedTuple):
 def make_solver_kernels(config: Sailfish, native_code: bool = False):
     """
     Build and return kernels needed by solver, or just the native code
+
+    Kernel classes are compiled when they are instantiated, so only those
+    which the configuration actually uses are created here.
     """
-    grad_est = GradientEstimation(config)
+    use_plm = type(config.scheme.reconstruction) is tuple
+    use_grad = use_plm and config.strategy.cache_grad
+    use_source_terms = config.coordinates != "cartesian"
+
+    grad_est = GradientEstimation(config) if use_grad else None
     fields = Fields(config)
     scheme = Scheme(config)
-    source_terms = SourceTerms(config)
+    source_terms = SourceTerms(config) if use_source_terms else None
+
+    if config.strategy.numba:
+        from solver_numba import NumbaScheme
+
+        update_cons = NumbaScheme(config).update_cons
+    else:
+        update_cons = scheme.update_cons
 
     if native_code:
-        return (
-            grad_est.__native_code__,
-            fields.__native_code__,
-            scheme.__native_code__,
-            source_terms.__native_code__,
+        return tuple(
+            k.__native_code__
+            for k in (grad_est, fields, scheme, source_terms)
+            if k is not None
         )
     else:
         return SolverKernels(
-            grad_est.plm_gradient,
-            scheme.update_cons,
+            grad_est.plm_gradient if grad_est else None,
+            update_cons,
             scheme.update_cons_from_fluxes,
             scheme.godunov_fluxes,
             fields.prim_to_cons_array,
             fields.cons_to_prim_array,
             fields.max_wavespeeds_array,
-            source_terms.geometric_source_terms,
+            source_terms.geometric_source_terms if source_terms else None,
         )
 
 
+def skip_flux_cache(config: Sailfish) -> bool:
+    """
+    Return True if cached Godunov fluxes would not save any work
+
+    Caching the fluxes avoids solving each Riemann problem twice. For
+    first-order (PCM) reconstruction with forward Euler time integration the
+    Riemann problems are cheap, and the fused `update_cons` kernel avoids
+    writing the flux array to memory and reading it back again. The two code
+    paths produce identical results.
+    """
+    return (
+        config.strategy.cache_flux
+        and config.scheme.reconstruction == "pcm"
+        and config.scheme.time_integration == "fwd"
+    )
+
+
 def make_stream(hardware: str, gpu_streams: str):
     """
     Return a maybe-concurrent execution context
@@ -1756,9 +1914,9 @@ def patch_solver(
     strategy = config.strategy
     hardware = strategy.hardware
     transpose = strategy.transpose
-    cache_flux = strategy.cache_flux
+    cache_flux = strategy.cache_flux and not skip_flux_cache(config)
     cache_prim = strategy.cache_prim
-    cache_grad = strategy.cache_grad
+    cache_grad = strategy.cache_grad and type(scheme.reconstruction) is tuple
     time_integration = scheme.time_integration
     initial_prim = config.initial_data.primitive
 
@@ -1791,17 +1949,18 @@ def patch_solver(
     del primitive
     yield FillGuardZones(p)
 
+    pu = space.create(xp.zeros, fields=nprim)  # scratch space for c2p_user
+
     def c2p_user(u):
         """
-        Return primitives in standard layout host memory and with no guards
-        """
-        p = space.create(xp.zeros, fields=nprim)
-        cons_to_prim(u, p)
+        Return primitives in standard layout device memory and with no guards
 
-        try:
-            return p[space.interior].get()
-        except AttributeError:
-            return p[space.interior]
+        The standard layout is fields-last, so if the solver uses the
+        fields-first layout the data is transposed here. The result is always
+        a copy; it does not share memory with the scratch array.
+        """
+        cons_to_prim(u, pu)
+        return xp.array(pu[space.interior], order="C")
 
     def amax(u):
         """
@@ -1843,6 +2002,7 @@ def patch_solver(
     # =========================================================================
     if rks:
         u0 = space.create(xp.zeros, fields=ncons)  # RK cons
+        prim_to_cons(p, u0)
     else:
         u0 = None
 
@@ -1892,6 +2052,7 @@ def patch_solver(
         udr = space.create(xp.zeros, fields=ncons)
         pdr = space.create(xp.zeros, fields=nprim, data=initial_prim(box))
         rdr = space.create(xp.zeros, fields=1, data=forcing.rate_array(box))
+        fwk = space.create(xp.zeros, fields=ncons)  # forcing workspace
         prim_to_cons(pdr, udr)
         del pdr
 
@@ -1901,7 +2062,7 @@ def patch_solver(
     # Main loop: yield states until the caller stops calling next
     # =========================================================================
     while True:
-        if rks:
+        if rks and cache_flux:
             u0[...] = u1[...]
 
         for rk in rks or [0.0]:
@@ -1915,7 +2076,10 @@ def patch_solver(
                 geometric_source_terms(p1, u1, xv, stm)
 
             if forcing is not None:
-                stm += (udr - u1) * rdr * dv
+                xp.subtract(udr, u1, out=fwk)
+                fwk *= rdr
+                fwk *= dv
+                stm += fwk
 
             if cache_grad:
                 plm_gradient(p1, g1)
@@ -1926,6 +2090,15 @@ def patch_solver(
                 update_cons(p1, g1, u0, u1, u2, stm, da, dv, dt, rk)
                 u1, u2 = u2, u1
 
+                if rks and rk == 0.0:
+                    # After the first stage, u2 holds the conserved data from
+                    # the start of the step, which is the RK anchor for the
+                    # later stages. Swap it into u0 rather than copying it.
+                    # All three buffers are initialized from the primitive
+                    # data, so guard zones which are never refilled (the
+                    # default, fixed boundary condition) agree in each.
+                    u0, u2 = u2, u0
+
             yield FillGuardZones(u1)
 
         t += dt
@@ -1973,7 +2146,11 @@ def make_solver(config: Sailfish, checkpoint: dict = None):
     logger = getLogger("sailfish")
 
     for kernel in (kernels := make_solver_kernels(config)):
-        logger.info(f"using kernel {kernel_metadata(kernel)}")
+        if kernel is not None:
+            logger.info(f"using kernel {kernel_metadata(kernel)}")
+
+    if skip_flux_cache(config):
+        logger.info("fwd and pcm use the fused update kernel; flux cache not used")
 
     boundary = config.boundary_condition
     strategy = config.strategy
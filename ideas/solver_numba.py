@@ -0,0 +1,280 @@
+"""
+Numba-compiled twin of the Godunov update kernel, for CPU runs
+
+The functions here mirror the native `Scheme.update_cons` kernel for Newtonian
+hydrodynamics. Arrays are indexed by their logical shape `(ni, nj, nk, nq)`,
+so both the fields-first and fields-last data layouts are supported.
+
+Only the update kernel is replaced: the primitive recovery, wavespeed, and
+source term kernels are still native, so the kernel toolchain (cffi and a C
+compiler) is required either way. The cache_flux strategy, which uses the
+native Godunov flux kernels, is not supported with numba.
+"""
+
+from numba import njit, prange
+from numpy import empty
+from numpy.typing import NDArray
+
+from config import Sailfish
+
+
+@njit(fastmath=True, error_model="numpy", cache=True)
+def _plm_minmod(yl, yc, yr, plm_theta):
+    a = (yc - yl) * plm_theta
+    b = (yr - yl) * 0.5
+    c = (yr - yc) * plm_theta
+    sa = 1.0 if a >= 0.0 else -1.0
+    sb = 1.0 if b >= 0.0 else -1.0
+    sc = 1.0 if c >= 0.0 else -1.0
+    return 0.25 * abs(sa + sb) * (sa + sc) * min(abs(a), abs(b), abs(c))
+
+
+@njit(fastmath=True, error_model="numpy", cache=True)
+def _prim_to_cons(p, u, gamma):
+    nq = p.shape[0]
+    rho = p[0]
+    pre = p[nq - 1]
+    v_squared = 0.0
+    u[0] = rho
+    for q in range(1, nq - 1):
+        u[q] = p[q] * rho
+        v_squared += p[q] * p[q]
+    u[nq - 1] = 0.5 * rho * v_squared + pre / (gamma - 1.0)
+
+
+@njit(fastmath=True, error_model="numpy", cache=True)
+def _cons_to_prim(u, p, gamma):
+    nq = u.shape[0]
+    rho = u[0]
+    nrg = u[nq - 1]
+    p_squared = 0.0
+    p[0] = rho
+    for q in range(1, nq - 1):
+        p[q] = u[q] / rho
+        p_squared += u[q] * u[q]
+    p[nq - 1] = (nrg - 0.5 * p_squared / rho) * (gamma - 1.0)
+
+
+@njit(fastmath=True, error_model="numpy", cache=True)
+def _riemann_hlle(pl, pr, ul, ur, flux, axis, gamma):
+    nq = pl.shape[0]
+    _prim_to_cons(pl, ul, gamma)
+    _prim_to_cons(pr, ur, gamma)
+    vl = pl[axis]
+    vr = pr[axis]
+    cl = (pl[nq - 1] / pl[0] * gamma) ** 0.5
+    cr = (pr[nq - 1] / pr[0] * gamma) ** 0.5
+    am = min(0.0, vl - cl, vr - cr)
+    ap = max(0.0, vl + cl, vr + cr)
+
+    for q in range(nq):
+        fl = vl * ul[q]
+        fr = vr * ur[q]
+        if q == axis:
+            fl += pl[nq - 1]
+            fr += pr[nq - 1]
+        if q == nq - 1:
+            fl += vl * pl[nq - 1]
+            fr += vr * pr[nq - 1]
+        flux[q] = (fl * ap - fr * am - (ul[q] - ur[q]) * ap * am) / (ap - am)
+
+
+@njit(fastmath=True, error_model="numpy", cache=True)
+def _godunov_flux(prd, grd, i, j, k, axis, use_plm, gamma, work, fh):
+    """
+    Godunov flux through the face on the left of zone (i, j, k) along an axis
+    """
+    di = int(axis == 1)
+    dj = int(axis == 2)
+    dk = int(axis == 3)
+    pm = work[0]
+    pp = work[1]
+
+    for q in range(prd.shape[3]):
+        pm[q] = prd[i - di, j - dj, k - dk, q]
+        pp[q] = prd[i, j, k, q]
+
+        if use_plm:
+            pm[q] += 0.5 * grd[i - di, j - dj, k - dk, axis - 1, q]
+            pp[q] -= 0.5 * grd[i, j, k, axis - 1, q]
+
+    _riemann_hlle(pm, pp, work[2], work[3], fh, axis, gamma)
+
+
+@njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+def _plm_gradient_array(prd, grd, plm_theta, dim):
+    """
+    Estimate PLM gradients along each axis, once per zone
+
+    Each gradient is needed by the Godunov fluxes on both faces of a zone, so
+    computing them here in a separate pass saves recomputing the minmod
+    limiter for every face.
+    """
+    ni, nj, nk, nq = prd.shape
+    j0, j1 = (1, nj - 1) if dim >= 2 else (0, nj)
+    k0, k1 = (1, nk - 1) if dim >= 3 else (0, nk)
+
+    for i in prange(1, ni - 1):
+        for j in range(j0, j1):
+            for k in range(k0, k1):
+                for a in range(dim):
+                    di = int(a == 0)
+                    dj = int(a == 1)
+                    dk = int(a == 2)
+
+                    for q in range(nq):
+                        yl = prd[i - di, j - dj, k - dk, q]
+                        yc = prd[i, j, k, q]
+                        yr = prd[i + di, j + dj, k + dk, q]
+                        grd[i, j, k, a, q] = _plm_minmod(yl, yc, yr, plm_theta)
+
+
+@njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+def _cons_to_prim_array(u, p, gamma):
+    ni, nj, nk, nq = u.shape
+
+    for i in prange(ni):
+        for j in range(nj):
+            for k in range(nk):
+                _cons_to_prim(u[i, j, k], p[i, j, k], gamma)
+
+
+@njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+def _update_cons(
+    prd, grd, urk, urd, uwr, stm, da, dv, dt, rk, use_plm, use_stm, gamma, dim
+):
+    ni, nj, nk, nq = urd.shape
+    j0, j1 = (2, nj - 2) if dim >= 2 else (0, nj)
+    k0, k1 = (2, nk - 2) if dim >= 3 else (0, nk)
+
+    for i in prange(2, ni - 2):
+        work = empty((4, nq))
+        fm = empty((3, nq))
+        fp = empty((3, nq))
+
+        for j in range(j0, j1):
+            for k in range(k0, k1):
+                for a in range(dim):
+                    di = int(a == 0)
+                    dj = int(a == 1)
+                    dk = int(a == 2)
+                    fl = fm[a]
+                    fr = fp[a]
+                    _godunov_flux(prd, grd, i, j, k, a + 1, use_plm, gamma, work, fl)
+                    _godunov_flux(
+                        prd,
+                        grd,
+                        i + di,
+                        j + dj,
+                        k + dk,
+                        a + 1,
+                        use_plm,
+                        gamma,
+                        work,
+                        fr,
+                    )
+
+                dt_dv = dt / dv[i, j, k, 0]
+
+                for q in range(nq):
+                    du = 0.0
+
+                    for a in range(dim):
+                        di = int(a == 0)
+                        dj = int(a == 1)
+                        dk = int(a == 2)
+                        am = da[i, j, k, a]
+                        ap = da[i + di, j + dj, k + dk, a]
+                        du -= fp[a, q] * ap - fm[a, q] * am
+
+                    if use_stm:
+                        du += stm[i, j, k, q]
+
+                    du *= dt_dv
+                    u1 = urd[i, j, k, q] + du
+
+                    if rk != 0.0:
+                        u1 += rk * (urk[i, j, k, q] - u1)
+
+                    uwr[i, j, k, q] = u1
+
+
+class NumbaScheme:
+    """
+    Numba implementation of the `Scheme.update_cons` kernel
+
+    Only Newtonian hydrodynamics is supported. The `update_cons` method has
+    the same signature as the native kernel, so the two are interchangeable
+    in the solver.
+    """
+
+    def __init__(self, config: Sailfish):
+        if config.physics.metric != "newtonian":
+            raise ValueError("numba kernels only implemented for newtonian hydro")
+
+        r = config.scheme.reconstruction
+
+        if type(r) is str:
+            plm_theta = 0.0
+            use_plm = False
+
+        if type(r) is tuple:
+            plm_theta = r[1]
+            use_plm = True
+
+        self._dim = config.domain.dimensionality
+        self._gamma = config.physics.equation_of_state.gamma_law_index
+        self._plm_theta = plm_theta
+        self._use_plm = use_plm
+
+    def update_cons(
+        self,
+        prd: NDArray[float],
+        grd: NDArray[float],
+        urk: NDArray[float],
+        urd: NDArray[float],
+        uwr: NDArray[float],
+        stm: NDArray[float],
+        da: NDArray[float],
+        dv: NDArray[float],
+        dt: float,
+        rk: float,
+        plm_theta: float = None,
+    ):
+        """
+        Update conserved quantities without pre-computed Godunov fluxes
+
+        See `Scheme.update_cons` for a description of the arguments. If `prd`
+        is `None` then primitives are computed from `urd` into a temporary
+        array. Likewise if `grd` is `None` and PLM reconstruction is used,
+        then gradients are estimated in a first pass over the primitives.
+        """
+        plm = plm_theta if plm_theta is not None else self._plm_theta
+        dim = self._dim
+
+        if prd is None:
+            prd = empty(urd.shape)
+            _cons_to_prim_array(urd, prd, self._gamma)
+
+        if not self._use_plm:
+            grd = empty((1, 1, 1, 1, 1))
+        elif grd is None:
+            grd = empty(prd.shape[:3] + (dim,) + prd.shape[3:])
+            _plm_gradient_array(prd, grd, plm, dim)
+
+        _update_cons(
+            prd,
+            grd,
+            urk if urk is not None else urd,
+            urd,
+            uwr,
+            stm if stm is not None else urd,
+            da,
+            dv,
+            dt,
+            rk if urk is not None else 0.0,
+            self._use_plm,
+            stm is not None,
+            self._gamma,
+            dim,
+        )
@@ -37,6 +37,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# A null context has no state, so a single instance can be shared (including
+# re-entrantly) by every CPU patch.
+null_context = nullcontext()
+
 
 build_config = {
     "enable_openmp": True,
@@ -127,7 +131,7 @@ def execution_context(mode, device_id=None):
     the GPU onto which kernel launches should be spawned.
     """
     if mode in ["cpu", "omp"]:
-        return nullcontext()
+        return null_context
 
     elif mode == "gpu":
         from cupy.cuda import Device
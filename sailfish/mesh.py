@@ -4,6 +4,7 @@ Contains classes for different mesh geometries and dimensionalities.
 
 from typing import NamedTuple
 from math import log, log10, pi
+from numpy import arange
 
 
 class PlanarCartesianMesh(NamedTuple):
@@ -43,10 +44,13 @@ class PlanarCartesianMesh(NamedTuple):
         return [self.zone_center(t, i) for i in range(i0, i1 or self.shape[0])]
 
     def faces(self, i0=0, i1=None):
+        """
+        Return an array of face positions for zone indexes in the given range.
+        """
         if i1 is None:
             i1 = self.shape[0]
         x0, dx = self.x0, self.dx
-        return [x0 + i * dx for i in range(i0, i1 + 1)]
+        return x0 + arange(i0, i1 + 1) * dx
 
 
 class LogSphericalMesh(NamedTuple):
@@ -128,7 +132,8 @@ class LogSphericalMesh(NamedTuple):
 
     def faces(self, i0=0, i1=None):
         """
-        Return radial face positions for zone indexes in the given range.
+        Return an array of radial face positions for zone indexes in the given
+        range.
 
         The positions are given in comoving coordinates, i.e. are
         time-independent. The number of faces `i1 - i0 + 1` is one more than
@@ -137,7 +142,7 @@ class LogSphericalMesh(NamedTuple):
         if i1 is None:
             i1 = self.shape[0]
         r0, k = self.r0, 1.0 / self.num_zones_per_decade
-        return [r0 * 10 ** (i * k) for i in range(i0, i1 + 1)]
+        return r0 * 10.0 ** (arange(i0, i1 + 1) * k)
 
     def cell_coordinates(self, t, i, j):
         """
@@ -159,10 +164,10 @@ class LogSphericalMesh(NamedTuple):
 
     def radial_vertices(self, time):
         """
-        Return a list of proper coordinates of the radial zone interfaces.
+        Return an array of proper coordinates of the radial zone interfaces.
         """
         a = self.scale_factor(time)
-        return [r * a for r in self.faces()]
+        return self.faces() * a
 
     @property
     def polar_vertices(self):
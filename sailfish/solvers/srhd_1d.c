@@ -6,6 +6,20 @@ AUTHOR: Jonathan Zrake
 DESCRIPTION:
   Solves relativistic hydrodynamics in 1D cartesian or spherical
   coordinates.
+
+TODO:
+    + consider a struct-of-arrays layout (one array per field) for the
+      primitive and conserved buffers; every zone currently reads and writes
+      its NCONS fields as a contiguous group, so this requires gathering to
+      and scattering from the zone-local arrays used by the physics routines
+    + a blocked (num_zones / 8, NCONS, 8) layout needs the same gather and
+      scatter as the struct-of-arrays layout; either way the zone loop would
+      need restructuring to process a block of zones per iteration, which
+      the data-dependent Newton iteration count and the HLLC branches make
+      hard to vectorize
+    + a single-precision primitive recovery would need its own convergence
+      criterion; the 1e-12 relative tolerance used here cannot be met in
+      float, so the Newton loop would always run to newton_iter_max
 */
 
 
@@ -550,7 +564,13 @@ PUBLIC void srhd_1d_advance_rk(
             for (int q = 0; q < NCONS; ++q)
             {
                 uwr[q] = urd[q] + (fli[q] * dal - fri[q] * dar + sources[q]) * dt;
-                uwr[q] = (1.0 - rk_param) * uwr[q] + rk_param * urk[q];
+            }
+            if (rk_param != 0.0)
+            {
+                for (int q = 0; q < NCONS; ++q)
+                {
+                    uwr[q] = (1.0 - rk_param) * uwr[q] + rk_param * urk[q];
+                }
             }
         }
     }
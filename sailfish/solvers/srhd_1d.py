@@ -14,6 +14,7 @@ below for RK1 and low-storage RK3 as well. The C code hard-codes a PLM theta
 value of 2.0.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from typing import NamedTuple
 from sailfish.kernel.library import Library
@@ -45,6 +46,10 @@ COORDINATES_DICT = {
     LogSphericalMesh: 1,
 }
 
+# Kernel libraries by execution mode, shared by all solver instances in the
+# process, so that repeated solver construction does not rebuild or reload them.
+_libraries = dict()
+
 
 def initial_condition(setup, mesh, i0, i1, time, xp):
     primitive = xp.zeros([i1 - i0, NUM_CONS])
@@ -72,6 +77,35 @@ class Patch:
     issuing calls to the solver kernel functions.
     """
 
+    # Slots give fixed-offset attribute access on the per-stage hot path
+    # (advance_rk, recompute_primitive), instead of instance dict lookups.
+    __slots__ = (
+        "lib",
+        "xp",
+        "index_range",
+        "fix_i0",
+        "fix_i1",
+        "num_zones",
+        "coordinates",
+        "time",
+        "time0",
+        "execution_context",
+        "scale_factor_initial",
+        "scale_factor_derivative",
+        "scale_factor",
+        "faces",
+        "wavespeeds",
+        "primitive1",
+        "conserved0",
+        "conserved1",
+        "conserved2",
+        "_conserved_free",
+        "_prim_dirty",
+        "_conserved_to_primitive",
+        "_advance_rk",
+        "_max_wavespeeds",
+    )
+
     def __init__(
         self,
         setup,
@@ -99,6 +133,9 @@ class Patch:
         self.coordinates = coordinates = COORDINATES_DICT[type(mesh)]
         self.time = self.time0 = time
         self.execution_context = execution_context
+        self._conserved_to_primitive = lib.srhd_1d_conserved_to_primitive[num_zones]
+        self._advance_rk = lib.srhd_1d_advance_rk[num_zones]
+        self._max_wavespeeds = lib.srhd_1d_max_wavespeeds[num_zones]
 
         try:
             adot = float(mesh.scale_factor_derivative)
@@ -108,45 +145,64 @@ class Patch:
             self.scale_factor_initial = 1.0
             self.scale_factor_derivative = 0.0
 
+        # The scale factor is updated along with the time, and is constant
+        # unless the mesh is expanding.
+        a0 = self.scale_factor_initial
+        self.scale_factor = a0 + self.scale_factor_derivative * time
+
         with execution_context:
             faces = xp.array(mesh.faces(*index_range))
             conserved_with_guard = xp.zeros([num_zones + 2 * ng, nq])
 
             if conserved is None:
+                # The interior slice is contiguous, so the kernel can write
+                # into it directly, without a scratch array.
                 primitive = initial_condition(setup, mesh, i0, i1, time, xp)
-                conserved = xp.zeros_like(primitive)
-
                 lib.srhd_1d_primitive_to_conserved[num_zones](
                     faces,
                     primitive,
-                    conserved,
+                    conserved_with_guard[ng:-ng],
                     self.scale_factor,
                     coordinates,
                 )
-                conserved_with_guard[ng:-ng] = conserved
             else:
                 conserved_with_guard[ng:-ng] = xp.array(conserved)
 
             self.faces = faces
             self.wavespeeds = xp.zeros(num_zones)
             self.primitive1 = xp.zeros_like(conserved_with_guard)
-            self.conserved0 = conserved_with_guard.copy()
-            self.conserved1 = conserved_with_guard.copy()
-            self.conserved2 = conserved_with_guard.copy()
+            self.conserved1 = conserved_with_guard
+
+            # The RK base state and scratch buffers are written before they
+            # are read, except in fixed zones, which the kernel never writes.
+            if fix_i0 or fix_i1:
+                self.conserved0 = conserved_with_guard.copy()
+                self.conserved2 = conserved_with_guard.copy()
+            else:
+                self.conserved0 = xp.empty_like(conserved_with_guard)
+                self.conserved2 = xp.empty_like(conserved_with_guard)
+
+        # Set whenever conserved1 or the time changes, so that primitives are
+        # only recovered (an iterative root-find in every zone) when needed.
+        self._prim_dirty = True
 
     def recompute_primitive(self):
+        if not self._prim_dirty:
+            return
+
         with self.execution_context:
-            self.lib.srhd_1d_conserved_to_primitive[self.num_zones](
+            self._conserved_to_primitive(
                 self.faces,
                 self.conserved1,
                 self.primitive1,
                 self.scale_factor,
                 self.coordinates,
             )
+        self._prim_dirty = False
 
     def advance_rk(self, rk_param, dt):
         with self.execution_context:
-            self.lib.srhd_1d_advance_rk[self.num_zones](
+            self._advance_rk(
                 self.faces,
                 self.conserved0,
                 self.primitive1,
@@ -162,12 +218,21 @@ class Patch:
                 self.coordinates,
             )
         self.time = self.time0 * rk_param + (self.time + dt) * (1.0 - rk_param)
-        self.conserved1, self.conserved2 = self.conserved2, self.conserved1
+
+        if self.scale_factor_derivative != 0.0:
+            a0 = self.scale_factor_initial
+            self.scale_factor = a0 + self.scale_factor_derivative * self.time
+
+        if self.conserved1 is self.conserved0:
+            self.conserved1, self.conserved2 = self.conserved2, self._conserved_free
+        else:
+            self.conserved1, self.conserved2 = self.conserved2, self.conserved1
+        self._prim_dirty = True
 
     def maximum_wavespeed(self):
         self.recompute_primitive()
         with self.execution_context:
-            self.lib.srhd_1d_max_wavespeeds[self.num_zones](
+            self._max_wavespeeds(
                 self.faces,
                 self.primitive1,
                 self.wavespeeds,
@@ -175,13 +240,21 @@ class Patch:
             )
             return float(self.wavespeeds.max())
 
-    @property
-    def scale_factor(self):
-        return self.scale_factor_initial + self.scale_factor_derivative * self.time
-
     def new_iteration(self):
+        """
+        Mark the current solution as the Runge-Kutta base state.
+
+        Rather than copying conserved1 to conserved0, the two are made to
+        reference the same buffer. The first stage leaves it intact by writing
+        to conserved2, and then takes the third (free) buffer as its next
+        write target.
+        """
         self.time0 = self.time
-        self.conserved0[...] = self.conserved1[...]
+
+        if self.conserved0 is not self.conserved1:
+            self._conserved_free = self.conserved0
+
+        self.conserved0 = self.conserved1
 
     @property
     def conserved(self):
@@ -209,11 +282,14 @@ class Solver(SolverBase):
         physics=dict(),
         options=dict(),
     ):
-        with open(__file__.replace(".py", ".c")) as f:
-            code = f.read()
-
         xp = get_array_module(mode)
-        lib = Library(code, mode=mode, debug=False)
+
+        try:
+            lib = _libraries[mode]
+        except KeyError:
+            with open(__file__.replace(".py", ".c")) as f:
+                code = f.read()
+            lib = _libraries[mode] = Library(code, mode=mode, debug=False)
 
         self._physics = physics = Physics(**physics)
         self._options = options = Options(**options)
@@ -261,13 +337,56 @@ class Solver(SolverBase):
         self.xp = xp
         self.patches = patches
 
+        # Neighbor patches and the boundary condition handlers are resolved
+        # once here, rather than on each call to set_bc. The domain is
+        # periodic unless the end patches have a handler to overwrite their
+        # outer guard zones.
+        self._neighbors = [
+            (patches[(n - 1) % num_patches], patches[(n + 1) % num_patches])
+            for n in range(num_patches)
+        ]
+        self._set_bc_lower = {
+            BC_OUTFLOW: self._set_bc_outflow_lower,
+            BC_INFLOW: self._set_bc_inflow_lower,
+            BC_REFLECT: self._set_bc_reflect_lower,
+        }.get(self.boundary_condition[0])
+        self._set_bc_upper = {
+            BC_OUTFLOW: self._set_bc_outflow_upper,
+            BC_INFLOW: self._set_bc_inflow_upper,
+            BC_REFLECT: self._set_bc_reflect_upper,
+        }.get(self.boundary_condition[1])
+
+        # In cpu mode, multiple patches are advanced concurrently; the kernels
+        # are called through ctypes, which releases the GIL for the duration
+        # of the call. In omp mode each kernel is already multi-threaded, and
+        # a single patch gains nothing from the pool, so it is not used then.
+        if num_patches > 1 and mode == "cpu":
+            self._pool = ThreadPoolExecutor(max_workers=num_patches)
+        else:
+            self._pool = None
+
+        # The gathered primitive array is reused until the next Runge-Kutta
+        # stage; advance_rk discards it.
+        self._primitive = None
+
     @property
     def solution(self):
         return concat_on_host([p.conserved for p in self.patches], self.num_guard)
 
     @property
     def primitive(self):
-        return concat_on_host([p.primitive for p in self.patches], self.num_guard)
+        """
+        Return the primitive data gathered to the host.
+
+        The array is shared between callers until the solution advances, so
+        it is marked read-only; copy it to modify it.
+        """
+        if self._primitive is None:
+            self._primitive = concat_on_host(
+                [p.primitive for p in self.patches], self.num_guard
+            )
+            self._primitive.flags.writeable = False
+        return self._primitive
 
     @property
     def time(self):
@@ -312,61 +431,94 @@ class Solver(SolverBase):
             self.advance_rk(b, dt)
 
     def advance_rk(self, rk_param, dt):
+        self._primitive = None
+
         for patch in self.patches:
             patch.recompute_primitive()
 
         self.set_bc("primitive1")
 
-        for patch in self.patches:
+        # One kernel launch per patch. A single batched launch over all patches
+        # would need pointer-array (double**) arguments, which the kernel
+        # library does not marshal, and could not span patches on different
+        # GPU devices.
+        def advance_patch(patch):
             patch.advance_rk(rk_param, dt)
 
+        if self._pool is not None:
+            list(self._pool.map(advance_patch, self.patches))
+        else:
+            for patch in self.patches:
+                advance_patch(patch)
+
     def set_bc(self, array):
-        ng = self.num_guard
-        num_patches = len(self.patches)
-        for ic in range(num_patches):
-            il = (ic + num_patches - 1) % num_patches
-            ir = (ic + num_patches + 1) % num_patches
-            pl = getattr(self.patches[il], array)
-            pc = getattr(self.patches[ic], array)
-            pr = getattr(self.patches[ir], array)
+        for ic, (patch, (left, right)) in enumerate(zip(self.patches, self._neighbors)):
+            pl = getattr(left, array)
+            pc = getattr(patch, array)
+            pr = getattr(right, array)
             self.set_bc_patch(pl, pc, pr, ic)
 
     def set_bc_patch(self, pl, pc, pr, patch_index):
+        ng = self.num_guard
+        patch = self.patches[patch_index]
+
+        with patch.execution_context:
+            self.xp.copyto(pc[:+ng], pl[-2 * ng : -ng])
+            self.xp.copyto(pc[-ng:], pr[+ng : +2 * ng])
+
+            if patch_index == 0 and self._set_bc_lower is not None:
+                self._set_bc_lower(pc, patch)
+
+            if patch_index == len(self.patches) - 1 and self._set_bc_upper is not None:
+                self._set_bc_upper(pc, patch)
+
+    def _set_bc_outflow_lower(self, pc, patch):
+        ng = self.num_guard
+        self.xp.copyto(pc[:+ng], pc[+ng : +2 * ng])
+
+    def _set_bc_outflow_upper(self, pc, patch):
+        ng = self.num_guard
+        self.xp.copyto(pc[-ng:], pc[-2 * ng : -ng])
+
+    def _set_bc_inflow_lower(self, pc, patch):
+        t = self.time
+        ng = self.num_guard
+        for i in range(-ng, 0):
+            x = self.mesh.zone_center(t, i)
+            self.setup.primitive(t, x, pc[i + ng])
+
+    def _set_bc_inflow_upper(self, pc, patch):
         t = self.time
         ni = self.mesh.shape[0]
         ng = self.num_guard
-        bcl, bcr = self.boundary_condition
-
-        with self.patches[patch_index].execution_context:
-            pc[:+ng] = pl[-2 * ng : -ng]
-            pc[-ng:] = pr[+ng : +2 * ng]
-
-            def negative_vel(p):
-                return self.xp.asarray([p[0], -p[1], p[2], p[3]])
-
-            if patch_index == 0:
-                if bcl == BC_OUTFLOW:
-                    pc[:+ng] = pc[+ng : +2 * ng]
-                elif bcl == BC_INFLOW:
-                    for i in range(-ng, 0):
-                        x = self.mesh.zone_center(t, i)
-                        self.setup.primitive(t, x, pc[i + ng])
-                elif bcl == BC_REFLECT:
-                    pc[0] = negative_vel(pc[3])
-                    pc[1] = negative_vel(pc[2])
-
-            if patch_index == len(self.patches) - 1:
-                if bcr == BC_OUTFLOW:
-                    pc[-ng:] = pc[-2 * ng : -ng]
-                elif bcr == BC_INFLOW:
-                    i0 = self.patches[patch_index].index_range[0]
-                    for i in range(ni, ni + ng):
-                        x = self.mesh.zone_center(t, i)
-                        self.setup.primitive(t, x, pc[i - i0 + ng])
-                elif bcr == BC_REFLECT:
-                    pc[-2] = negative_vel(pc[-3])
-                    pc[-1] = negative_vel(pc[-4])
+        i0 = patch.index_range[0]
+        for i in range(ni, ni + ng):
+            x = self.mesh.zone_center(t, i)
+            self.setup.primitive(t, x, pc[i - i0 + ng])
+
+    def _set_bc_reflect_lower(self, pc, patch):
+        ng = self.num_guard
+        self.xp.copyto(pc[:+ng], pc[2 * ng - 1 : ng - 1 : -1])
+        pc[:+ng, 1] *= -1.0
+
+    def _set_bc_reflect_upper(self, pc, patch):
+        ng = self.num_guard
+        self.xp.copyto(pc[-ng:], pc[-ng - 1 : -2 * ng - 1 : -1])
+        pc[-ng:, 1] *= -1.0
 
     def new_iteration(self):
         for patch in self.patches:
             patch.new_iteration()
+
+    def close(self):
+        """
+        Shut down the thread pool used to advance patches, if there is one.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def __del__(self):
+        # The pool may be missing if __init__ raised before creating it.
+        if getattr(self, "_pool", None) is not None:
+            self.close()
@@ -1,20 +1,39 @@
 import argparse
 import pickle
 import sys
+from functools import lru_cache
 
 sys.path.insert(1, ".")
 
 
-def load_checkpoint(filename, require_solver=None):
+@lru_cache(maxsize=1)
+def read_checkpoint(filename):
+    # The file named on the command line is read once to detect the solver,
+    # and then again by the plotting function; keep the last one in memory.
     with open(filename, "rb") as file:
-        chkpt = pickle.load(file)
+        return pickle.load(file)
+
+
+def load_checkpoint(filename, require_solver=None):
+    chkpt = read_checkpoint(filename)
+
+    if require_solver is not None and chkpt["solver"] != require_solver:
+        raise ValueError(
+            f"checkpoint is from a run with solver {chkpt['solver']}, "
+            f"expected {require_solver}"
+        )
+    return chkpt
+
+
+def decimate(f, max_pixels=2000):
+    """
+    Stride a 2d image array so its larger side is at most about `max_pixels`.
 
-        if require_solver is not None and chkpt["solver"] != require_solver:
-            raise ValueError(
-                f"checkpoint is from a run with solver {chkpt['solver']}, "
-                f"expected {require_solver}"
-            )
-        return chkpt
+    Images much larger than the figure are downsampled by the renderer anyway,
+    so this just saves rasterizing and encoding pixels that are not seen.
+    """
+    stride = max(1, max(f.shape) // max_pixels)
+    return f[::stride, ::stride]
 
 
 def main_srhd_1d():
@@ -203,6 +222,11 @@ def main_cbdiso_2d():
         action="store_true",
         help="save PNG files instead of showing a window",
     )
+    parser.add_argument(
+        "--hires",
+        action="store_true",
+        help="save PNG files at full resolution and 400 dpi",
+    )
     parser.add_argument(
         "--draw-lindblad31-radius",
         action="store_true",
@@ -279,6 +303,9 @@ def main_cbdiso_2d():
         if args.log:
             f = np.log10(f)
 
+        if not args.hires:
+            f = decimate(f)
+
         extent = mesh.x0, mesh.x1, mesh.y0, mesh.y1
         cm = ax.imshow(
             f,
@@ -313,7 +340,7 @@ def main_cbdiso_2d():
         if args.save:
             pngname = filename.replace(".pk", ".png")
             print(pngname)
-            fig.savefig(pngname, dpi=400)
+            fig.savefig(pngname, dpi=400 if args.hires else 150)
     if not args.save:
         plt.show()
 
@@ -362,6 +389,11 @@ def main_cbdgam_2d():
         type=float,
         help="maximum value for colormap",
     )
+    parser.add_argument(
+        "--hires",
+        action="store_true",
+        help="plot at full resolution",
+    )
 
     args = parser.parse_args()
 
@@ -375,6 +407,9 @@ def main_cbdgam_2d():
         if args.log:
             f = np.log10(f)
 
+        if not args.hires:
+            f = decimate(f)
+
         extent = mesh.x0, mesh.x1, mesh.y0, mesh.y1
         cm = ax.imshow(
             f,